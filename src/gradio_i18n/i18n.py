@@ -1,129 +1,271 @@
-import functools
+import codecs
+import collections
+import copy
 import inspect
 import json
 import os
+import sys
 from contextlib import contextmanager
+from dataclasses import dataclass
 
 import gradio as gr
 import langcodes
 import yaml
 from gradio.blocks import Block, BlockContext, Context, LocalContext
 
+try:
+    # libyaml-backed loader/dumper, typically 5-10x faster than the
+    # pure-Python SafeLoader/SafeDumper
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    # Optional accelerated JSON codec for large translation files
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Monkey patch to escape I18nString type being stripped in gradio.Markdown.
+# Gradio calls inspect.cleandoc on every Markdown render, so the non-I18n
+# case is kept to one exact-class check and a tail call to the original.
+def _cleandoc(doc, *, _orig=inspect.cleandoc):
+    if doc.__class__ is I18nString:
+        result = I18nString(_orig(doc))
+        if result.__class__ is I18nString:
+            result.add_values = doc.add_values
+            result.radd_values = doc.radd_values
+        return result
+    return _orig(doc)
+
 
-# Monkey patch to escape I18nString type being stripped in gradio.Markdown
-def escape_caller(func):
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        if args and isinstance(args[0], I18nString):
-            add_values = args[0].add_values
-            radd_values = args[0].radd_values
-            result = I18nString(func(*args, **kwargs))
-            result.add_values = add_values
-            result.radd_values = radd_values
+inspect.cleandoc = _cleandoc
 
-            return result
-        return func(*args, **kwargs)
 
-    return wrapper
+# Fast-path flag: stays False until the first real translation entry is
+# registered, letting I18nString skip all context/dict lookups during UI
+# construction and in apps that never load translations
+_HAS_ANY_TRANSLATIONS = False
 
+# Bound once; saves the LocalContext.request attribute walk on every render
+_REQUEST_VAR = LocalContext.request
 
-inspect.cleandoc = escape_caller(inspect.cleandoc)
+# Per-session language choices, LRU-bounded so long-running deployments don't
+# accumulate an entry per browser session forever
+_LANG_PER_SESSION = collections.OrderedDict()
+_MAX_SESSIONS = 10_000
 
 
 class TranslateContext:
     dictionary: dict = {}
 
+    # Flattened (lang, key) -> value view of `dictionary` for the hot lookup
+    # path; a single hash probe instead of two chained dict lookups
+    _flat: dict = {}
+
+    # Bumped by add_translation; consumers holding derived caches compare
+    # against it to know when to rebuild
+    _version: int = 0
+
+    # Frozen views of dictionary's keys, rebuilt only when translations are
+    # added; spares per-call key iteration and lowercasing
+    _available_langs: tuple = ()
+    _lowered_langs: dict = {}
+
+    @staticmethod
     def add_translation(translation: dict):
         for k, v in translation.items():
+            k = sys.intern(k)
             if k not in TranslateContext.dictionary:
                 TranslateContext.dictionary[k] = {}
-            TranslateContext.dictionary[k].update(v)
+                # A new language can change how pending headers resolve
+                TranslateContext._accept_lang_cache.clear()
+            table = TranslateContext.dictionary[k]
+            for ik, iv in v.items():
+                # Interned keys/values share storage across languages and
+                # hash by identity in dict probes
+                if isinstance(ik, str):
+                    ik = sys.intern(ik)
+                if isinstance(iv, str):
+                    # hotfix, remove unexpected single quotes; doing it once
+                    # at load keeps the render path a plain lookup
+                    while len(iv) >= 2 and iv[0] == "'" == iv[-1]:
+                        iv = iv[1:-1]
+                    iv = sys.intern(iv)
+                table[ik] = iv
+                TranslateContext._flat[(k, ik)] = iv
+
+        TranslateContext._version += 1
+        TranslateContext._available_langs = tuple(TranslateContext.dictionary)
+        TranslateContext._lowered_langs = {
+            lang.lower(): lang for lang in TranslateContext._available_langs
+        }
+
+        if TranslateContext._flat:
+            global _HAS_ANY_TRANSLATIONS
+            _HAS_ANY_TRANSLATIONS = True
 
+    @staticmethod
     def get_available_languages():
-        return list(TranslateContext.dictionary.keys())
+        return list(TranslateContext._available_langs)
+
+    # Resolved Accept-Language headers, keyed by the raw header string.
+    # Bounded: headers are client-controlled, so don't grow without limit
+    _accept_lang_cache = {}
+    _MAX_ACCEPT_LANG_CACHE = 256
 
-    lang_per_session = {}
+    lang_per_session = _LANG_PER_SESSION
 
+    @staticmethod
     def get_current_language(request: gr.Request):
-        return TranslateContext.lang_per_session.get(
+        return _LANG_PER_SESSION.get(
             request.session_hash, TranslateContext.default_language
         )
 
+    @staticmethod
     def set_current_language(request: gr.Request, lang: str):
-        TranslateContext.lang_per_session[request.session_hash] = lang
+        _LANG_PER_SESSION[request.session_hash] = lang
+        _LANG_PER_SESSION.move_to_end(request.session_hash)
+        if len(_LANG_PER_SESSION) > _MAX_SESSIONS:
+            _LANG_PER_SESSION.popitem(last=False)
 
     default_language = "en"
 
+    @staticmethod
     def get_default_language():
         return TranslateContext.default_language
 
+    @staticmethod
     def set_default_language(lang: str):
         TranslateContext.default_language = lang
 
 
+# The flat table object is mutated in place and never rebound, so a module
+# alias is safe and saves an attribute hop in I18nString's hot methods
+_FLAT = TranslateContext._flat
+
+
 def get_lang_from_request(request: gr.Request):
-    lang = request.headers["Accept-Language"].split(",")[0]
-    lang, _ = langcodes.closest_match(lang, TranslateContext.get_available_languages())
+    header = request.headers["Accept-Language"]
+    cached = TranslateContext._accept_lang_cache.get(header)
+    if cached is not None:
+        return cached
 
-    if not lang:
-        return "en"
+    lowered = TranslateContext._lowered_langs
+
+    # Drop the q-value and try exact then primary-subtag matches before
+    # falling back to the expensive langcodes distance scoring
+    tag = header.split(",")[0].split(";")[0].strip()
+    lang = lowered.get(tag.lower())
+    if lang is None:
+        lang = lowered.get(tag.split("-")[0].lower())
+    if lang is None:
+        lang, _ = langcodes.closest_match(tag, TranslateContext._available_langs)
+        if not lang:
+            lang = "en"
+
+    if len(TranslateContext._accept_lang_cache) < TranslateContext._MAX_ACCEPT_LANG_CACHE:
+        TranslateContext._accept_lang_cache[header] = lang
     return lang
 
 
 class I18nString(str):
-    def __new__(cls, value):
-        request: gr.Request = LocalContext.request.get()
-        if request is None:
-            return super().__new__(cls, value)
+    # No per-instance __dict__; the concat lists stay None until first use so
+    # the common case (no concatenations) allocates nothing beyond the str.
+    # Translation tables are keyed by exact interned strs only - instances of
+    # this subclass are never stored as dict keys - so table probes keep
+    # CPython's unicode-only lookup fast path. Keeping the metadata in slots
+    # rather than an external side table avoids keying anything by id() (ids
+    # are reused) and keeps instances safe to copy/pickle.
+    __slots__ = ("add_values", "radd_values", "_unwrapped")
+
+    # Pre-bound base methods; skips the super() proxy on the per-render path
+    _str_str = str.__str__
+    _str_hash = str.__hash__
 
-        lang = TranslateContext.get_current_language(request)
-        result = TranslateContext.dictionary.get(lang, {}).get(value, value)
-        return result
-
-    def __init__(self, value):
+    def __new__(cls, value):
+        if _HAS_ANY_TRANSLATIONS:
+            request: gr.Request = _REQUEST_VAR.get()
+            if request is not None:
+                lang = TranslateContext.get_current_language(request)
+                # Probe with an exact str so hashing stays on the C fast path
+                # instead of dispatching through I18nString.__hash__/__eq__
+                if type(value) is not str and isinstance(value, str):
+                    key = I18nString._str_str(value)
+                else:
+                    key = value
+                result = _FLAT.get((lang, key))
+                if result is None:
+                    # No translation: hand back the original object untouched
+                    return value
+                return result
+
+        # Authoring path (no request context): build a real I18nString.
+        # Attributes are populated here so no separate __init__ pass is
+        # needed; the translated returns above bypass __init__ anyway.
+        self = super().__new__(cls, value)
         if isinstance(value, I18nString):
             self.add_values = value.add_values
             self.radd_values = value.radd_values
         else:
-            self.add_values = []
-            self.radd_values = []
+            self.add_values = None
+            self.radd_values = None
+        self._unwrapped = None
+        return self
 
     def __str__(self):
-        request: gr.Request = LocalContext.request.get()
+        # Concatenations must still be resolved even without translations
+        if not _HAS_ANY_TRANSLATIONS and not self.add_values and not self.radd_values:
+            return self
+
+        request: gr.Request = _REQUEST_VAR.get()
         if request is None:
             return self
 
         lang = TranslateContext.get_current_language(request)
-        result = TranslateContext.dictionary.get(lang, {}).get(self, super().__str__())
-
-        for v in self.radd_values:
-            result = str(v) + result
-
-        for v in self.add_values:
-            result = result + str(v)
-
-        # hotfix, remove unexpected single quotes
-        while len(result) >= 2 and result.startswith("'") and result.endswith("'"):
-            result = result[1:-1]
+        # unwrap_tuple()[0] is the cached exact-str form of this key
+        key = self.unwrap_tuple()[0]
+        result = _FLAT.get((lang, key))
+        if result is None:
+            result = key
+
+        radd = self.radd_values
+        add = self.add_values
+        if radd or add:
+            # Build once with join instead of quadratic pairwise concatenation
+            parts = [str(v) for v in reversed(radd)] if radd else []
+            parts.append(result)
+            if add:
+                parts.extend(str(v) for v in add)
+            result = "".join(parts)
 
         return result
 
     def __add__(self, other):
         v = str(self)
         if isinstance(v, I18nString):
+            if self.add_values is None:
+                self.add_values = []
             self.add_values.append(other)
+            self._unwrapped = None
             return self
         return v.__add__(other)
 
     def __radd__(self, other):
         v = str(self)
         if isinstance(v, I18nString):
+            if self.radd_values is None:
+                self.radd_values = []
             self.radd_values.append(other)
+            self._unwrapped = None
             return self
         return other.__add__(v)
 
     def __hash__(self) -> int:
-        return super().__hash__()
+        return I18nString._str_hash(self)
 
     def format(self, *args, **kwargs) -> str:
         v = str(self)
@@ -132,17 +274,27 @@ class I18nString(str):
         return v.format(*args, **kwargs)
 
     def unwrap(self):
-        return super().__str__()
+        return I18nString._str_str(self)
+
+    def unwrap_tuple(self):
+        """Tuple of the source keys of this string and its concatenations,
+        cached on the instance (identical across languages)"""
+        cached = self._unwrapped
+        if cached is None:
+            cached = self._unwrapped = tuple(I18nString.unwrap_strings(self))
+        return cached
 
     @staticmethod
     def unwrap_strings(obj):
         """Unwrap all keys in I18nStrings in the object"""
         if isinstance(obj, I18nString):
             yield obj.unwrap()
-            for v in obj.add_values:
-                yield from I18nString.unwrap_strings(v)
-            for v in obj.radd_values:
-                yield from I18nString.unwrap_strings(v)
+            if obj.add_values:
+                for v in obj.add_values:
+                    yield from I18nString.unwrap_strings(v)
+            if obj.radd_values:
+                for v in obj.radd_values:
+                    yield from I18nString.unwrap_strings(v)
             return
         yield obj
 
@@ -151,28 +303,47 @@ def gettext(key: str):
     """Wrapper text string to return I18nString
     :param key: The key of the I18nString
     """
-    return I18nString(key)
+    return I18nString(sys.intern(key))
 
 
 def iter_i18n_choices(choices):
-    """Iterate all I18nStrings in the choice, returns the indices of the I18nStrings"""
+    """Iterate all I18nStrings in the choice, returns (index, key) pairs of
+    the I18nStrings"""
     if not isinstance(choices, list) or len(choices) == 0:
         return
 
-    if isinstance(choices[0], tuple):
-        for i, (k, v) in enumerate(choices):
-            if isinstance(k, I18nString):
-                yield i
+    for i, c in enumerate(choices):
+        k = c[0] if isinstance(c, tuple) else c
+        if isinstance(k, I18nString):
+            yield i, k
 
-    else:
-        for i, v in enumerate(choices):
-            if isinstance(v, I18nString):
-                yield i
+
+# Gradio component fields that may carry user-facing strings. Iterating this
+# short list avoids inspect.getmembers(), which enumerates (and triggers) every
+# attribute and property on the component.
+_I18N_CANDIDATE_FIELDS = (
+    "label",
+    "info",
+    "placeholder",
+    "value",
+    "title",
+    "description",
+    "choices",
+)
+
+
+_MISSING = object()
+
+# Shared default for table lookups; saves allocating a throwaway {} per miss
+_EMPTY = {}
 
 
 def iter_i18n_fields(component: gr.components.Component):
     """Iterate all I18nStrings in the component"""
-    for name, value in inspect.getmembers(component):
+    for name in _I18N_CANDIDATE_FIELDS:
+        value = getattr(component, name, _MISSING)
+        if value is _MISSING:
+            continue
         if name == "value" and hasattr(component, "choices"):
             # for those components with choices, the value will be kept as is
             continue
@@ -184,13 +355,87 @@ def iter_i18n_fields(component: gr.components.Component):
 
 def iter_i18n_components(block: Block):
     """Iterate all I18nStrings in the block"""
-    if isinstance(block, BlockContext):
-        for component in block.children:
-            for c in iter_i18n_components(component):
-                yield c
+    stack = [block]
+    while stack:
+        b = stack.pop()
+        if isinstance(b, BlockContext):
+            stack.extend(reversed(b.children))
+        if any(iter_i18n_fields(b)):
+            yield b
+
+
+@dataclass(frozen=True)
+class _I18nPlan:
+    """Precomputed traversal of a block tree: which components carry
+    I18nStrings, in which fields, and at which choice indices."""
+
+    components: list
+    fields_per_component: list
+    # (index, key) pairs from iter_i18n_choices for each component's choices
+    choice_entries_per_component: list
+    # Direct child count of the root at build time; a cheap staleness check
+    # for when the UI is extended after the plan was cached
+    num_children: int
+
+    def __iter__(self):
+        return iter(
+            zip(
+                self.components,
+                self.fields_per_component,
+                self.choice_entries_per_component,
+            )
+        )
+
 
-    if any(iter_i18n_fields(block)):
-        yield block
+def _build_i18n_plan(block: Block) -> _I18nPlan:
+    components = []
+    fields_per_component = []
+    choice_entries_per_component = []
+    # One walk collecting fields as it goes; going through
+    # iter_i18n_components would scan each component's fields twice (once
+    # for detection, once for collection)
+    stack = [block]
+    while stack:
+        b = stack.pop()
+        if isinstance(b, BlockContext):
+            stack.extend(reversed(b.children))
+        fields = tuple(iter_i18n_fields(b))
+        if not fields:
+            continue
+        if "choices" in fields:
+            entries = tuple(iter_i18n_choices(b.choices))
+        else:
+            entries = ()
+        components.append(b)
+        fields_per_component.append(fields)
+        choice_entries_per_component.append(entries)
+    return _I18nPlan(
+        components,
+        fields_per_component,
+        choice_entries_per_component,
+        len(getattr(block, "children", ())),
+    )
+
+
+def _get_i18n_plan(block: Block) -> _I18nPlan:
+    plan = getattr(block, "_i18n_plan", None)
+    if plan is None or plan.num_children != len(getattr(block, "children", ())):
+        plan = _build_i18n_plan(block)
+        block._i18n_plan = plan
+    return plan
+
+
+def _collect_i18n_keys(plan: _I18nPlan):
+    """Set of all source keys referenced by the plan's components"""
+    keys = set()
+    for component, fields, choice_entries in plan:
+        for field in fields:
+            if field == "choices":
+                for _, value in choice_entries:
+                    keys.update(value.unwrap_tuple())
+            else:
+                keys.update(getattr(component, field).unwrap_tuple())
+    return keys
 
 
 def has_new_i18n_fields(block: Block, langs=["en"], existing_translation={}):
@@ -200,23 +445,11 @@ def has_new_i18n_fields(block: Block, langs=["en"], existing_translation={}):
     :param existing_translation: The existing translation dictionary
     :return: True if there are new I18nStrings, False otherwise
     """
-    components = list(iter_i18n_components(block))
+    keys = _collect_i18n_keys(_get_i18n_plan(block))
 
     for lang in langs:
-        for component in components:
-            for field in iter_i18n_fields(component):
-                if field == "choices":
-                    for idx in iter_i18n_choices(component.choices):
-                        if isinstance(component.choices[idx], tuple):
-                            value = component.choices[idx][0]
-                        else:
-                            value = component.choices[idx]
-                        if value not in existing_translation.get(lang, {}):
-                            return True
-                else:
-                    value = getattr(component, field)
-                    if value not in existing_translation.get(lang, {}):
-                        return True
+        if not keys <= existing_translation.get(lang, _EMPTY).keys():
+            return True
 
     return False
 
@@ -228,33 +461,87 @@ def dump_blocks(block: Block, langs=["en"], include_translations={}):
     :param include_translations: The existing translation dictionary
     :return: The dumped dictionary
     """
-    components = list(iter_i18n_components(block))
-
-    def translate(lang, key):
-        return include_translations.get(lang, {}).get(key, key)
+    plan = _get_i18n_plan(block)
 
     ret = {}
 
     for lang in langs:
-        ret[lang] = {}
-        for component in components:
-            for field in iter_i18n_fields(component):
+        # Hoist the per-language table; one .get per lang instead of one per
+        # key (each with a throwaway {} default)
+        table = include_translations.get(lang, _EMPTY)
+        entry = ret[lang] = {}
+        for component, fields, choice_entries in plan:
+            for field in fields:
                 if field == "choices":
-                    for idx in iter_i18n_choices(component.choices):
-                        if isinstance(component.choices[idx], tuple):
-                            value = component.choices[idx][0]
-                        else:
-                            value = component.choices[idx]
-                        for key in I18nString.unwrap_strings(value):
-                            ret[lang][key] = translate(lang, key)
+                    for _, value in choice_entries:
+                        for key in value.unwrap_tuple():
+                            entry[key] = table.get(key, key)
                 else:
                     value = getattr(component, field)
-                    for key in I18nString.unwrap_strings(value):
-                        ret[lang][key] = translate(lang, key)
+                    for key in value.unwrap_tuple():
+                        entry[key] = table.get(key, key)
 
     return ret
 
 
+def _resolve_value(value, table):
+    """Resolve an I18nString (and its accumulated concatenations) against a
+    single language table without going through the request context."""
+    if not isinstance(value, I18nString):
+        return value if isinstance(value, str) else str(value)
+
+    key = value.unwrap()
+    result = table.get(key, key) if table is not None else key
+
+    if value.radd_values:
+        for v in value.radd_values:
+            result = _resolve_value(v, table) + result
+
+    if value.add_values:
+        for v in value.add_values:
+            result = result + _resolve_value(v, table)
+
+    return result
+
+
+def _build_lang_updates(plan: _I18nPlan, lang: str):
+    """Build the gr.update payload for every component in the plan for one
+    language. Translations are static per app, so the result is cacheable."""
+    table = TranslateContext.dictionary.get(lang)
+    updates = []
+
+    for component, fields, _choice_entries in plan:
+        modified = {}
+
+        for field in fields:
+            if field == "choices":
+                # Single pass, single allocation; we don't need to translate
+                # the values, only the displayed keys
+                modified[field] = [
+                    (
+                        _resolve_value(c[0], table),
+                        next(I18nString.unwrap_strings(c[1])),
+                    )
+                    if isinstance(c, tuple)
+                    else (
+                        _resolve_value(c, table),
+                        next(I18nString.unwrap_strings(c)),
+                    )
+                    for c in component.choices
+                ]
+            else:
+                value = getattr(component, field)
+                # A field that lost its I18nString (e.g. reassigned after
+                # setup) renders the same in every language; leaving it out
+                # of the payload skips the redundant frontend update
+                if isinstance(value, I18nString):
+                    modified[field] = _resolve_value(value, table)
+
+        updates.append(gr.update(**modified))
+
+    return updates
+
+
 def translate_blocks(
     block: gr.Blocks = None,
     translation={},
@@ -274,7 +561,8 @@ def translate_blocks(
     if not isinstance(block, gr.Blocks):
         raise ValueError("block must be an instance of gradio.Blocks")
 
-    components = list(iter_i18n_components(block))
+    plan = _get_i18n_plan(block)
+    components = plan.components
     TranslateContext.add_translation(translation)
 
     hidden = gr.HTML(
@@ -291,67 +579,106 @@ def translate_blocks(
         except ImportError:
             raise ValueError("gradio>=5.6.0 is required for persistant language")
 
+    lang_updates = {}
+    updates_version = TranslateContext._version
+
     def on_lang_change(request: gr.Request, lang: str, saved_lang: str):
+        nonlocal updates_version
+
         if not lang:
             if saved_lang:
                 lang = saved_lang
             else:
                 lang = get_lang_from_request(request)
 
-        outputs = [lang, lang, ""]
         if TranslateContext.get_current_language(request) == lang:
-            for component in components:
-                outputs.append(gr.update())
-            return outputs
+            return [lang, lang, ""] + [gr.update() for _ in components]
 
         TranslateContext.set_current_language(request, lang)
 
-        for component in components:
-            fields = list(iter_i18n_fields(component))
-            if component == lang and "value" in fields:
-                raise ValueError("'lang' component can't has I18nStrings as value")
-
-            modified = {}
-
-            for field in fields:
-                if field == "choices":
-                    choices = component.choices.copy()
-                    for idx in iter_i18n_choices(choices):
-                        if isinstance(choices[idx], tuple):
-                            k, v = choices[idx]
-                            # We don't need to translate the value
-                            choices[idx] = (str(k), next(I18nString.unwrap_strings(v)))
-                        else:
-                            v = choices[idx]
-                            choices[idx] = (str(v), next(I18nString.unwrap_strings(v)))
-                    modified[field] = choices
-                else:
-                    modified[field] = str(getattr(component, field))
-
-            new_comp = gr.update(**modified)
-            outputs.append(new_comp)
+        if updates_version != TranslateContext._version:
+            lang_updates.clear()
+            updates_version = TranslateContext._version
 
-        if len(outputs) == 1:
-            return outputs[0]
+        updates = lang_updates.get(lang)
+        if updates is None:
+            updates = lang_updates[lang] = _build_lang_updates(plan, lang)
 
-        return outputs
+        # Copy the cached payloads so downstream postprocessing can't mutate them
+        return [lang, lang, ""] + [copy.copy(u) for u in updates]
 
-    if lang is None:
+    lang_provided = lang is not None
+    if not lang_provided:
         lang = gr.State()
 
+    for component, fields, _ in plan:
+        if component == lang and "value" in fields:
+            raise ValueError("'lang' component can't has I18nStrings as value")
+
     if persistant:
         saved_lang = gr.BrowserState(storage_key="lang")
     else:
         saved_lang = gr.State()
 
+    # Without a caller-supplied lang component nothing can change the
+    # language after load, so don't register the change edge at all
+    events = [block.load, lang.change] if lang_provided else [block.load]
+
     gr.on(
-        [block.load, lang.change],
+        events,
         on_lang_change,
         inputs=[lang, saved_lang],
         outputs=[lang, saved_lang, hidden] + components,
     )
 
 
+# Parsed translation files keyed by path, as (mtime, dict)
+_TRANSLATION_FILE_CACHE = {}
+
+# Signature of the last placeholder scan; when neither the UI shape nor the
+# translation file changed, the whole scan/dump/write pass is skipped
+_last_scan_sig = None
+
+
+def _scan_signature(block: Block, path: str):
+    plan = _get_i18n_plan(block)
+    mtime = os.stat(path).st_mtime if os.path.exists(path) else None
+    num_choices = sum(
+        len(c.choices) if hasattr(c, "choices") else 0 for c in plan.components
+    )
+    return (id(block), len(plan.components), num_choices, mtime)
+
+
+def _load_translation_file(path: str):
+    """Load a translation file, reusing the parsed result while the file's
+    mtime is unchanged."""
+    mtime = os.stat(path).st_mtime
+    cached = _TRANSLATION_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # Force utf-8; "utf-8-sig" additionally eats a BOM if an editor left one,
+    # without any exception-driven encoding probing
+    if path.endswith(".json"):
+        if orjson is not None:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data.startswith(codecs.BOM_UTF8):
+                data = data[len(codecs.BOM_UTF8) :]
+            translation_dict = orjson.loads(data)
+        else:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                translation_dict = json.load(f)
+    elif path.endswith(".yaml"):
+        with open(path, "r", encoding="utf-8-sig") as f:
+            translation_dict = yaml.load(f, Loader=_YamlLoader)
+    else:
+        raise ValueError("Unsupported file format")
+
+    _TRANSLATION_FILE_CACHE[path] = (mtime, translation_dict)
+    return translation_dict
+
+
 @contextmanager
 def Translate(
     translation,
@@ -377,13 +704,7 @@ def Translate(
     elif isinstance(translation, str):
         if os.path.exists(translation):
             # Regard as a file path
-            with open(translation, "r", encoding="utf-8") as f:  # Force utf-8 encoding
-                if translation.endswith(".json"):
-                    translation_dict = json.load(f)
-                elif translation.endswith(".yaml"):
-                    translation_dict = yaml.safe_load(f)
-                else:
-                    raise ValueError("Unsupported file format")
+            translation_dict = _load_translation_file(translation)
         else:
             translation_dict = {}
     else:
@@ -394,19 +715,38 @@ def Translate(
         block=block, translation=translation_dict, lang=lang, persistant=persistant
     )
 
-    if (
-        placeholder_langs
-        and isinstance(translation, str)
-        and has_new_i18n_fields(
-            block, langs=placeholder_langs, existing_translation=translation_dict
-        )
-    ):
-        merged = dump_blocks(
-            block, langs=placeholder_langs, include_translations=translation_dict
-        )
+    if placeholder_langs and isinstance(translation, str):
+        global _last_scan_sig
+        sig = _scan_signature(block, translation)
+        if sig != _last_scan_sig:
+            if has_new_i18n_fields(
+                block, langs=placeholder_langs, existing_translation=translation_dict
+            ):
+                merged = dump_blocks(
+                    block,
+                    langs=placeholder_langs,
+                    include_translations=translation_dict,
+                )
 
-        with open(translation, "w") as f:
-            if translation.endswith(".json"):
-                json.dump(merged, f, indent=2, ensure_ascii=False)
-            elif translation.endswith(".yaml"):
-                yaml.dump(merged, f, allow_unicode=True, sort_keys=False)
+                if translation.endswith(".json"):
+                    if orjson is not None:
+                        with open(translation, "wb") as f:
+                            f.write(orjson.dumps(merged, option=orjson.OPT_INDENT_2))
+                    else:
+                        with open(translation, "w") as f:
+                            json.dump(merged, f, indent=2, ensure_ascii=False)
+                elif translation.endswith(".yaml"):
+                    with open(translation, "w") as f:
+                        yaml.dump(
+                            merged,
+                            f,
+                            Dumper=_YamlDumper,
+                            allow_unicode=True,
+                            sort_keys=False,
+                        )
+
+                mtime = os.stat(translation).st_mtime
+                _TRANSLATION_FILE_CACHE[translation] = (mtime, merged)
+                sig = sig[:-1] + (mtime,)
+
+            _last_scan_sig = sig